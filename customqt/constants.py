@@ -1,9 +1,12 @@
 import ctypes
+from ctypes import wintypes
 
 class Windows:
-    user32: ctypes.WinDLL = ctypes.windll.user32
-    dwmapi: ctypes.WinDLL = ctypes.windll.dwmapi
-    gdi32: ctypes.WinDLL = ctypes.windll.gdi32
+    # Private handles: signatures declared below must not leak into the
+    # process-wide ctypes.windll objects other libraries call through
+    user32: ctypes.WinDLL = ctypes.WinDLL("user32")
+    dwmapi: ctypes.WinDLL = ctypes.WinDLL("dwmapi")
+    gdi32: ctypes.WinDLL = ctypes.WinDLL("gdi32")
 
     # WINDOWS MESSAGES
     WM_NCMOUSEMOVE: int = 0x00A0
@@ -14,6 +17,7 @@ class Windows:
     WM_GETMINMAXINFO: int = 0x0024
     WM_SIZE: int = 0x0005
     WM_WINDOWPOSCHANGED: int = 0x0047
+    WM_ENTERSIZEMOVE: int = 0x0231
     WM_EXITSIZEMOVE: int = 0x0232
     WM_DPICHANGED: int = 0x02E0
     WM_NCLBUTTONDOWN: int = 0x00A1
@@ -103,4 +107,49 @@ class Windows:
     HWND_NOTOPMOST: int = -2
     ERROR_SUCCESS: int = 0
     ERROR_INVALID_PARAMETER: int = 87
-    HKEY_LOCAL_MACHINE: int = 0x80000002
\ No newline at end of file
+    HKEY_LOCAL_MACHINE: int = 0x80000002
+
+
+# WIN32 FUNCTION SIGNATURES
+# Declared once so ctypes does not re-infer argument conversion on every call
+_user32 = Windows.user32
+_gdi32 = Windows.gdi32
+_dwmapi = Windows.dwmapi
+
+_user32.GetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int]
+_user32.GetWindowLongW.restype = ctypes.c_long
+_user32.SetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int, ctypes.c_long]
+_user32.SetWindowLongW.restype = ctypes.c_long
+_user32.SetWindowPos.argtypes = [
+    wintypes.HWND, wintypes.HWND, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_uint
+]
+_user32.SetWindowPos.restype = wintypes.BOOL
+_user32.IsZoomed.argtypes = [wintypes.HWND]
+_user32.IsZoomed.restype = wintypes.BOOL
+_user32.ShowWindow.argtypes = [wintypes.HWND, ctypes.c_int]
+_user32.ShowWindow.restype = wintypes.BOOL
+_user32.MonitorFromWindow.argtypes = [wintypes.HWND, wintypes.DWORD]
+_user32.MonitorFromWindow.restype = wintypes.HANDLE
+_user32.GetMonitorInfoW.argtypes = [wintypes.HANDLE, ctypes.c_void_p]
+_user32.GetMonitorInfoW.restype = wintypes.BOOL
+_user32.SetWindowRgn.argtypes = [wintypes.HWND, wintypes.HRGN, wintypes.BOOL]
+_user32.SetWindowRgn.restype = ctypes.c_int
+_user32.GetWindowRect.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.RECT)]
+_user32.GetWindowRect.restype = wintypes.BOOL
+_user32.GetClientRect.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.RECT)]
+_user32.GetClientRect.restype = wintypes.BOOL
+_user32.SetCursor.argtypes = [wintypes.HANDLE]
+_user32.SetCursor.restype = wintypes.HANDLE
+# lpCursorName takes a MAKEINTRESOURCE ordinal; cast IDC_* values to LPCWSTR
+_user32.LoadCursorW.argtypes = [wintypes.HINSTANCE, wintypes.LPCWSTR]
+_user32.LoadCursorW.restype = wintypes.HANDLE
+
+_gdi32.CreateRoundRectRgn.argtypes = [ctypes.c_int] * 6
+_gdi32.CreateRoundRectRgn.restype = wintypes.HRGN
+_gdi32.DeleteObject.argtypes = [wintypes.HGDIOBJ]
+_gdi32.DeleteObject.restype = wintypes.BOOL
+
+_dwmapi.DwmSetWindowAttribute.argtypes = [wintypes.HWND, wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD]
+_dwmapi.DwmSetWindowAttribute.restype = ctypes.c_long
+_dwmapi.DwmEnableBlurBehindWindow.argtypes = [wintypes.HWND, ctypes.c_void_p]
+_dwmapi.DwmEnableBlurBehindWindow.restype = ctypes.c_long
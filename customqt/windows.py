@@ -8,11 +8,150 @@ from PySide6.QtCore import Qt
 import sys
 import ctypes
 from ctypes import wintypes
-from typing import Callable, Optional, Tuple, cast, Union
+from typing import Callable, Dict, FrozenSet, Optional, Tuple, cast, Union
 
-from . import constants
+from .constants import Windows as _W
 import time
 
+# Bind DLLs and constants as module globals so hot paths skip the
+# constants.Windows attribute chain
+user32 = _W.user32
+dwmapi = _W.dwmapi
+gdi32 = _W.gdi32
+
+DWMNCRP_DISABLED = _W.DWMNCRP_DISABLED
+DWMWA_NCRENDERING_POLICY = _W.DWMWA_NCRENDERING_POLICY
+DWMWA_WINDOW_CORNER_PREFERENCE = _W.DWMWA_WINDOW_CORNER_PREFERENCE
+DWMWCP_DONOTROUND = _W.DWMWCP_DONOTROUND
+DWMWCP_ROUND = _W.DWMWCP_ROUND
+DWM_BB_ENABLE = _W.DWM_BB_ENABLE
+GWL_STYLE = _W.GWL_STYLE
+HTBOTTOM = _W.HTBOTTOM
+HTBOTTOMLEFT = _W.HTBOTTOMLEFT
+HTBOTTOMRIGHT = _W.HTBOTTOMRIGHT
+HTCAPTION = _W.HTCAPTION
+HTLEFT = _W.HTLEFT
+HTMAXBUTTON = _W.HTMAXBUTTON
+HTRIGHT = _W.HTRIGHT
+HTTOP = _W.HTTOP
+HTTOPLEFT = _W.HTTOPLEFT
+HTTOPRIGHT = _W.HTTOPRIGHT
+IDC_HAND = _W.IDC_HAND
+MONITOR_DEFAULTTONEAREST = _W.MONITOR_DEFAULTTONEAREST
+SWP_FRAMECHANGED = _W.SWP_FRAMECHANGED
+SWP_NOMOVE = _W.SWP_NOMOVE
+SWP_NOSIZE = _W.SWP_NOSIZE
+SW_MAXIMIZE = _W.SW_MAXIMIZE
+SW_RESTORE = _W.SW_RESTORE
+WM_DPICHANGED = _W.WM_DPICHANGED
+WM_ENTERSIZEMOVE = _W.WM_ENTERSIZEMOVE
+WM_EXITSIZEMOVE = _W.WM_EXITSIZEMOVE
+WM_GETMINMAXINFO = _W.WM_GETMINMAXINFO
+WM_NCACTIVATE = _W.WM_NCACTIVATE
+WM_NCCALCSIZE = _W.WM_NCCALCSIZE
+WM_NCHITTEST = _W.WM_NCHITTEST
+WM_NCLBUTTONDBLCLK = _W.WM_NCLBUTTONDBLCLK
+WM_NCLBUTTONDOWN = _W.WM_NCLBUTTONDOWN
+WM_NCLBUTTONUP = _W.WM_NCLBUTTONUP
+WM_NCPAINT = _W.WM_NCPAINT
+WM_SETCURSOR = _W.WM_SETCURSOR
+WM_SIZE = _W.WM_SIZE
+WM_WINDOWPOSCHANGED = _W.WM_WINDOWPOSCHANGED
+WS_CAPTION = _W.WS_CAPTION
+WS_THICKFRAME = _W.WS_THICKFRAME
+
+def _detect_win11() -> bool:
+    """Check if running on Windows 11 or later."""
+    try:
+        version = sys.getwindowsversion()
+        # Windows 11 is build 22000 or higher
+        return version.major >= 10 and version.build >= 22000
+    except Exception:
+        return False
+
+# Track if running on Windows 11 for API compatibility
+_IS_WIN11 = _detect_win11()
+
+# Per-message handler; returning None falls through to Qt's nativeEvent
+_MessageHandler = Callable[[wintypes.MSG], Optional[Tuple[bool, int]]]
+_NativeEventHandler = Callable[[Union[QByteArray, bytes, bytearray], int], Tuple[bool, int]]
+
+# Event type Qt uses for messages coming from the window procedure
+_WIN_EVENT_TYPE = QByteArray(b"windows_generic_MSG")
+
+# Byte offset of MSG.message, used to peek the id without building a MSG
+_MSG_MESSAGE_OFFSET = wintypes.MSG.message.offset
+_c_uint = ctypes.c_uint32
+
+# Resize hit-test codes indexed by edge bitmask:
+# bit 0 = left, bit 1 = right, bit 2 = top, bit 3 = bottom.
+# Corners win over edges and top/left win when the window is thinner than
+# two borders; 0 means no resize area (fall through to the title bar).
+_HIT_LUT: Tuple[int, ...] = (
+    0,              # none
+    HTLEFT,         # left
+    HTRIGHT,        # right
+    HTLEFT,         # left + right
+    HTTOP,          # top
+    HTTOPLEFT,      # top + left
+    HTTOPRIGHT,     # top + right
+    HTTOPLEFT,      # top + left + right
+    HTBOTTOM,       # bottom
+    HTBOTTOMLEFT,   # bottom + left
+    HTBOTTOMRIGHT,  # bottom + right
+    HTBOTTOMLEFT,   # bottom + left + right
+    HTTOP,          # top + bottom
+    HTTOPLEFT,      # top + bottom + left
+    HTTOPRIGHT,     # top + bottom + right
+    HTTOPLEFT,      # all
+)
+
+# Structures used by WM_GETMINMAXINFO handling
+class POINT(ctypes.Structure):
+    _fields_ = [("x", wintypes.LONG), ("y", wintypes.LONG)]
+
+class MINMAXINFO(ctypes.Structure):
+    _fields_ = [
+        ("ptReserved", POINT),
+        ("ptMaxSize", POINT),
+        ("ptMaxPosition", POINT),
+        ("ptMinTrackSize", POINT),
+        ("ptMaxTrackSize", POINT),
+    ]
+
+class MONITORINFOEX(ctypes.Structure):
+    _fields_ = [
+        ("cbSize", wintypes.DWORD),
+        ("rcMonitor", wintypes.RECT),
+        ("rcWork", wintypes.RECT),
+        ("dwFlags", wintypes.DWORD),
+        ("szDevice", wintypes.WCHAR * 32),
+    ]
+
+_MONITORINFOEX_SIZE = ctypes.sizeof(MONITORINFOEX)
+
+class DWM_BLURBEHIND(ctypes.Structure):
+    _fields_ = [
+        ("dwFlags", wintypes.DWORD),
+        ("fEnable", wintypes.BOOL),
+        ("hRgnBlur", wintypes.HRGN),
+        ("fTransitionOnMaximized", wintypes.BOOL),
+    ]
+
+# Blur settings never change, so the struct is built once and reused
+_ENABLE_BLUR_BLOB = DWM_BLURBEHIND(
+    dwFlags=DWM_BB_ENABLE,
+    fEnable=True,
+    hRgnBlur=0,
+    fTransitionOnMaximized=False,
+)
+
+# Region cache key for a window with no clipping region (maximized)
+_NO_REGION = (True, 0, 0, 0)
+
+# Trailing corner re-apply delay while the user drags a resize/move
+_SIZEMOVE_DEBOUNCE_MS = 150
+
 class WindowsStyler:
     def __init__(
         self,
@@ -48,26 +187,60 @@ class WindowsStyler:
         
         # Debounce timer for corner application
         self._corner_timer: Optional[QTimer] = None
-        self._last_corner_apply = 0.0
+        self._last_corner_apply = 0  # time.monotonic_ns() of last apply
+        # True between WM_ENTERSIZEMOVE and WM_EXITSIZEMOVE
+        self._in_sizemove = False
+        # Set while _post_init batches frame setup
+        self._suspend_corners = False
         
-        # Track if running on Windows 11 for API compatibility
-        self._is_windows_11 = self._check_windows_11()
+        # Corner strategy is fixed per OS version, so pick it once
+        self._apply_round_impl: Callable[[bool], None] = (
+            self._apply_round_dwm if _IS_WIN11 else self._apply_round_gdi
+        )
         
-        # Track cursor state for maximize button
-        self._original_cursor = None
+        # Last (maximized, width, height, radius) region handed to SetWindowRgn
+        self._last_applied_region: Optional[Tuple[bool, int, int, int]] = None
+
+        # Last DWMWA_WINDOW_CORNER_PREFERENCE value set on Windows 11
+        self._last_corner_pref: Optional[int] = None
+
+        # Hit-test thresholds, refreshed lazily after WM_SIZE/WM_DPICHANGED
+        self._hittest_cache_valid = False
+        self._cached_bw = 0
+        self._cached_w_minus_bw = 0
+        self._cached_h_minus_bw = 0
+        
+        # Hand cursor shown over the maximize button
+        self._hcur_hand: Optional[int] = None
+
+        # Message dispatch table; anything not listed goes straight to Qt
+        self._dispatch: Dict[int, _MessageHandler] = {
+            WM_SETCURSOR: self._handle_setcursor,
+            WM_NCCALCSIZE: self._handle_nc_block,
+            WM_NCLBUTTONDOWN: self._handle_nclbutton,
+            WM_NCLBUTTONUP: self._handle_nclbutton,
+            WM_NCLBUTTONDBLCLK: self._handle_nclbutton,
+            WM_GETMINMAXINFO: self._handle_getminmax,
+            WM_SIZE: self._handle_resize,
+            WM_WINDOWPOSCHANGED: self._handle_geometry_change,
+            WM_ENTERSIZEMOVE: self._handle_enter_sizemove,
+            WM_EXITSIZEMOVE: self._handle_exit_sizemove,
+            WM_DPICHANGED: self._handle_resize,
+        }
+        # WM_NCHITTEST/WM_NCPAINT/WM_NCACTIVATE are answered before the
+        # dispatch lookup, so they only need to pass the fast-reject test.
+        # A frozenset is deliberate: an int bitmap up to WM_DPICHANGED is
+        # ~737 bits wide and every shift allocates, which measured slower.
+        self._handled_msgs: FrozenSet[int] = frozenset(self._dispatch) | {
+            WM_NCHITTEST,
+            WM_NCPAINT,
+            WM_NCACTIVATE,
+        }
+        self._native_event: _NativeEventHandler = self._make_native_event()
         
         # Set initial window flags for frameless style
         self._setWindowFlags()
 
-    def _check_windows_11(self) -> bool:
-        """Check if running on Windows 11 or later."""
-        try:
-            version = sys.getwindowsversion()
-            # Windows 11 is build 22000 or higher
-            return version.major >= 10 and version.build >= 22000
-        except Exception:
-            return False
-
     def init(self) -> None:
         """Call this after window is created but before showing it."""
         if sys.platform != "win32":
@@ -94,45 +267,82 @@ class WindowsStyler:
         # Validate hwnd before proceeding
         if not self.hwnd:
             raise RuntimeError("Failed to get valid window handle")
+
+        # Resolve Win32 entry points once instead of per message
+        self._bind_apis()
+
+        # System cursor handles are shared and live for the whole process
+        self._hcur_hand = self._LoadCursorW(0, ctypes.cast(IDC_HAND, wintypes.LPCWSTR))
+
+        # Single reusable timer for debounced corner application
+        self._corner_timer = QTimer(self.window)
+        self._corner_timer.setSingleShot(True)
+        self._corner_timer.timeout.connect(self._apply_corners_now)
             
         # Monkey patch nativeEvent and state functions for custom handling
-        setattr(self.window, "nativeEvent", self.nativeEvent)
+        setattr(self.window, "nativeEvent", self._native_event)
         setattr(self.window, "showMaximized", self.showMaximized)
         setattr(self.window, "showNormal", self.showNormal)
         setattr(self.window, "isMaximized", self.isMaximized)
 
-        # Apply Win32 frame styles and effects
-        self.setup_win32_frame()
-        self._debounced_apply_corners()
-        self.enable_acrylic_blur()
-        
+        # Apply Win32 frame styles and effects behind a single frame change;
+        # the WM_SIZE/WM_WINDOWPOSCHANGED it triggers must not re-arm corners
+        self._suspend_corners = True
+        try:
+            self._apply_frame_styles()
+            self.enable_acrylic_blur()
+            self._notify_frame_changed()
+        finally:
+            self._suspend_corners = False
+        self._apply_corners_now()
+
+    def _bind_apis(self) -> None:
+        """Cache frequently used Win32 functions (signatures are declared in constants)."""
+        self._SetCursor = user32.SetCursor
+        self._LoadCursorW = user32.LoadCursorW
+        self._IsZoomed = user32.IsZoomed
+        self._ShowWindow = user32.ShowWindow
+        self._GetWindowRect = user32.GetWindowRect
+        self._GetClientRect = user32.GetClientRect
+        self._SetWindowRgn = user32.SetWindowRgn
+        self._CreateRoundRectRgn = gdi32.CreateRoundRectRgn
+        self._DeleteObject = gdi32.DeleteObject
+        self._MonitorFromWindow = user32.MonitorFromWindow
+        self._GetMonitorInfoW = user32.GetMonitorInfoW
 
     def setup_win32_frame(self) -> None:
         """Set window styles and disable default DWM non-client rendering."""
         if not self.hwnd:
             return
-            
+
+        self._apply_frame_styles()
+        self._notify_frame_changed()
+
+    def _apply_frame_styles(self) -> None:
+        """Update window style bits and DWM rendering policy without a frame change."""
         # Modify window style to enable resizing and disable caption
-        style: int = constants.Windows.user32.GetWindowLongW(self.hwnd, constants.Windows.GWL_STYLE)
-        style |= constants.Windows.WS_THICKFRAME
-        style &= ~constants.Windows.WS_CAPTION
-        constants.Windows.user32.SetWindowLongW(self.hwnd, constants.Windows.GWL_STYLE, style)
-        # Notify Windows that frame has changed
-        constants.Windows.user32.SetWindowPos(
+        style: int = user32.GetWindowLongW(self.hwnd, GWL_STYLE)
+        style |= WS_THICKFRAME
+        style &= ~WS_CAPTION
+        user32.SetWindowLongW(self.hwnd, GWL_STYLE, style)
+        # Disable DWM non-client rendering for custom frame
+        dwmapi.DwmSetWindowAttribute(
+            self.hwnd,
+            DWMWA_NCRENDERING_POLICY,
+            ctypes.byref(ctypes.c_int(DWMNCRP_DISABLED)),
+            ctypes.sizeof(ctypes.c_int),
+        )
+
+    def _notify_frame_changed(self) -> None:
+        """Notify Windows that frame has changed."""
+        user32.SetWindowPos(
             self.hwnd,
             0,
             0,
             0,
             0,
             0,
-            constants.Windows.SWP_NOMOVE | constants.Windows.SWP_NOSIZE | constants.Windows.SWP_FRAMECHANGED,
-        )
-        # Disable DWM non-client rendering for custom frame
-        constants.Windows.dwmapi.DwmSetWindowAttribute(
-            self.hwnd,
-            constants.Windows.DWMWA_NCRENDERING_POLICY,
-            ctypes.byref(ctypes.c_int(constants.Windows.DWMNCRP_DISABLED)),
-            ctypes.sizeof(ctypes.c_int),
+            SWP_NOMOVE | SWP_NOSIZE | SWP_FRAMECHANGED,
         )
 
     def nativeEvent(
@@ -141,195 +351,209 @@ class WindowsStyler:
         """
         Custom native event handler intercepting Windows messages.
         """
-        if eventType == b"windows_generic_MSG":
-            msg: wintypes.MSG = wintypes.MSG.from_address(int(message))
-            
-            # Block default non-client painting and activation
-            if msg.message in (constants.Windows.WM_NCPAINT, constants.Windows.WM_NCACTIVATE):
-                return True, 0
-
-            # Handle cursor changes for maximize button
-            if msg.message == constants.Windows.WM_SETCURSOR:
-                ht = int(msg.lParam) & 0xFFFF
-                if ht == constants.Windows.HTMAXBUTTON:
-                    # Set hand cursor when hovering maximize button
-                    if not self._original_cursor:
-                        self._original_cursor = constants.Windows.user32.GetCursor()
-                    hcur = constants.Windows.user32.LoadCursorW(0, constants.Windows.IDC_HAND)
-                    if hcur:
-                        constants.Windows.user32.SetCursor(hcur)
-                        return True, 1
-                else:
-                    # Restore original cursor when not on maximize button
-                    if self._original_cursor:
-                        constants.Windows.user32.SetCursor(self._original_cursor)
-                        self._original_cursor = None
-            
-            # Block default non-client calculations and painting
-            if msg.message in (constants.Windows.WM_NCCALCSIZE, constants.Windows.WM_NCPAINT, constants.Windows.WM_NCACTIVATE):
-                return True, 0
-
-            # Handle maximize button mouse events
-            if msg.message in (constants.Windows.WM_NCLBUTTONDOWN, constants.Windows.WM_NCLBUTTONUP, constants.Windows.WM_NCLBUTTONDBLCLK):
-                try:
-                    ht = int(msg.wParam)
-                except (ValueError, OverflowError):
-                    ht = None
-
-                if ht == constants.Windows.HTMAXBUTTON:
-                    if msg.message == constants.Windows.WM_NCLBUTTONDOWN:
-                        # Block default maximize button press
-                        return True, 0
-                    if msg.message in (constants.Windows.WM_NCLBUTTONUP, constants.Windows.WM_NCLBUTTONDBLCLK):
-                        # Toggle maximized state on button release/double-click
-                        old_maximized = self.isMaximized()
-                        if old_maximized:
-                            constants.Windows.user32.ShowWindow(self.hwnd, constants.Windows.SW_RESTORE)
-                        else:
-                            constants.Windows.user32.ShowWindow(self.hwnd, constants.Windows.SW_MAXIMIZE)
-                        
-                        # Update maximize button appearance
-                        self._update_maximize_button_state(not old_maximized)
-                        self._debounced_apply_corners()
-                        return True, 0
-            
-            # Enforce minimum/maximum window sizing
-            if msg.message == constants.Windows.WM_GETMINMAXINFO:
-                return self._handle_getminmax(msg)
-            
-            # Custom hit-testing for resize/drag
-            elif msg.message == constants.Windows.WM_NCHITTEST:
-                return self._handle_hittest()
-
-            # Schedule rounded corners update on resize/move/snap/DPI change
-            elif msg.message in (
-                constants.Windows.WM_SIZE,
-                constants.Windows.WM_WINDOWPOSCHANGED,
-                constants.Windows.WM_EXITSIZEMOVE,
-                constants.Windows.WM_DPICHANGED,
-            ):
-                self._debounced_apply_corners()
+        return self._native_event(eventType, message)
+
+    def _make_native_event(self) -> _NativeEventHandler:
+        """Build the installed nativeEvent with its fast-reject state held in closure cells."""
+        orig_native = self._orig_native
+        handled_msgs = self._handled_msgs
+        handle_message = self._handle_message
+        win_event_type = _WIN_EVENT_TYPE
+        read_uint = _c_uint.from_address
+        message_offset = _MSG_MESSAGE_OFFSET
+
+        def native_event(
+            eventType: Union[QByteArray, bytes, bytearray], message: int
+        ) -> Tuple[bool, int]:
+            # Compare against a prebuilt QByteArray so no bytes conversion is needed
+            if eventType != win_event_type:
+                return cast(Tuple[bool, int], orig_native(eventType, message)) #type: ignore
+
+            addr = message if isinstance(message, int) else int(message)
+            m = read_uint(addr + message_offset).value
+
+            # Most messages are not ours; hand them straight back to Qt
+            if m not in handled_msgs:
+                return cast(Tuple[bool, int], orig_native(eventType, message)) #type: ignore
+
+            return handle_message(m, addr, eventType, message)
+
+        return native_event
+
+    def _handle_message(
+        self, m: int, addr: int, eventType: Union[QByteArray, bytes, bytearray], message: int
+    ) -> Tuple[bool, int]:
+        """Handle a message that passed the fast-reject test."""
+        # Hit-testing fires on every mouse move and needs no MSG fields
+        if m == WM_NCHITTEST:
+            return self._handle_hittest()
+
+        # Block default non-client painting and activation
+        if m == WM_NCPAINT or m == WM_NCACTIVATE:
+            return True, 0
+
+        handler = self._dispatch.get(m)
+        if handler is not None:
+            # Only materialize the full MSG for messages we handle
+            result = handler(wintypes.MSG.from_address(addr))
+            if result is not None:
+                return result
 
         # Fallback to original handler if not handled
         return cast(Tuple[bool, int], self._orig_native(eventType, message)) #type: ignore
 
+    def _handle_nc_block(self, msg: wintypes.MSG) -> Tuple[bool, int]:
+        """Block default non-client size calculation."""
+        return True, 0
+
+    def _handle_setcursor(self, msg: wintypes.MSG) -> Optional[Tuple[bool, int]]:
+        """Handle cursor changes for maximize button."""
+        ht = int(msg.lParam) & 0xFFFF
+        if ht == HTMAXBUTTON and self._hcur_hand:
+            # Set hand cursor when hovering maximize button
+            self._SetCursor(self._hcur_hand)
+            return True, 1
+        # Everywhere else the default handler picks the right (resize) cursor
+        return None
+
+    def _handle_nclbutton(self, msg: wintypes.MSG) -> Optional[Tuple[bool, int]]:
+        """Handle maximize button mouse events."""
+        try:
+            ht = int(msg.wParam)
+        except (ValueError, OverflowError):
+            return None
+
+        if ht != HTMAXBUTTON:
+            return None
+
+        if msg.message == WM_NCLBUTTONDOWN:
+            # Block default maximize button press
+            return True, 0
+
+        # Toggle maximized state on button release/double-click
+        old_maximized = self.isMaximized()
+        if old_maximized:
+            self._ShowWindow(self.hwnd, SW_RESTORE)
+        else:
+            self._ShowWindow(self.hwnd, SW_MAXIMIZE)
+
+        # Update maximize button appearance
+        self._update_maximize_button_state(not old_maximized)
+        self._debounced_apply_corners()
+        return True, 0
+
+    def _handle_geometry_change(self, msg: wintypes.MSG) -> None:
+        """Schedule rounded corners update on resize/move/snap/DPI change."""
+        self._debounced_apply_corners()
+
+    def _handle_resize(self, msg: wintypes.MSG) -> None:
+        """Invalidate cached hit-test geometry and schedule a corner update."""
+        self._invalidate_hittest_cache()
+        self._debounced_apply_corners()
+
+    def _handle_enter_sizemove(self, msg: wintypes.MSG) -> None:
+        """Start coalescing corner updates for the duration of a drag."""
+        self._in_sizemove = True
+
+    def _handle_exit_sizemove(self, msg: wintypes.MSG) -> None:
+        """Apply corners once the resize/move drag has finished."""
+        self._in_sizemove = False
+        if self._corner_timer is not None:
+            self._corner_timer.stop()
+        self._apply_corners_now()
+
     def _handle_getminmax(self, msg: wintypes.MSG) -> Tuple[bool, int]:
         """Adjust maximized window size to the working area and enforce Qt minimum size."""
-        # Validate message structure
-        if not msg.lParam:
+        # Validate message structure and window handle up front
+        if not msg.lParam or not self.hwnd:
             return False, 0
-            
-        try:
-            # Define POINT and MINMAXINFO structures for sizing
-            class POINT(ctypes.Structure):
-                _fields_ = [("x", wintypes.LONG), ("y", wintypes.LONG)]
-
-            class MINMAXINFO(ctypes.Structure):
-                _fields_ = [
-                    ("ptReserved", POINT),
-                    ("ptMaxSize", POINT),
-                    ("ptMaxPosition", POINT),
-                    ("ptMinTrackSize", POINT),
-                    ("ptMaxTrackSize", POINT),
-                ]
-
-            info: MINMAXINFO = MINMAXINFO.from_address(msg.lParam)
-            
-            # Get monitor info for correct maximized sizing
-            if not self.hwnd:
-                return False, 0
-                
-            monitor = constants.Windows.user32.MonitorFromWindow(
-                self.hwnd, constants.Windows.MONITOR_DEFAULTTONEAREST
-            )
-            if not monitor:
-                return False, 0
-
-            # Define MONITORINFOEX structure for monitor details
-            class MONITORINFOEX(ctypes.Structure):
-                _fields_ = [
-                    ("cbSize", wintypes.DWORD),
-                    ("rcMonitor", wintypes.RECT),
-                    ("rcWork", wintypes.RECT),
-                    ("dwFlags", wintypes.DWORD),
-                    ("szDevice", wintypes.WCHAR * 32),
-                ]
-
-            monitor_info = MONITORINFOEX()
-            monitor_info.cbSize = ctypes.sizeof(MONITORINFOEX)
-            
-            if not constants.Windows.user32.GetMonitorInfoW(monitor, ctypes.byref(monitor_info)):
-                return False, 0
-
-            work = monitor_info.rcWork
-            full = monitor_info.rcMonitor
 
-            # Set maximized window size and position to working area
-            info.ptMaxPosition.x = work.left - full.left
-            info.ptMaxPosition.y = work.top - full.top
-            info.ptMaxSize.x = work.right - work.left
-            info.ptMaxSize.y = work.bottom - work.top
+        info: MINMAXINFO = MINMAXINFO.from_address(msg.lParam)
 
-            # Enforce Qt minimum window size
-            min_width = max(self.window.minimumWidth(), 200)  # Reasonable minimum
-            min_height = max(self.window.minimumHeight(), 100)
-            info.ptMinTrackSize.x = min_width
-            info.ptMinTrackSize.y = min_height
+        # Get monitor info for correct maximized sizing
+        monitor = self._MonitorFromWindow(self.hwnd, MONITOR_DEFAULTTONEAREST)
+        if not monitor:
+            return False, 0
 
-            return True, 0
-            
-        except (OSError, ValueError) as e:
-            # Log error but don't crash
-            print(f"Error in _handle_getminmax: {e}")
+        monitor_info = MONITORINFOEX()
+        monitor_info.cbSize = _MONITORINFOEX_SIZE
+        
+        if not self._GetMonitorInfoW(monitor, ctypes.byref(monitor_info)):
             return False, 0
 
+        work = monitor_info.rcWork
+        full = monitor_info.rcMonitor
+
+        # Set maximized window size and position to working area
+        info.ptMaxPosition.x = work.left - full.left
+        info.ptMaxPosition.y = work.top - full.top
+        info.ptMaxSize.x = work.right - work.left
+        info.ptMaxSize.y = work.bottom - work.top
+
+        # Enforce Qt minimum window size
+        min_width = max(self.window.minimumWidth(), 200)  # Reasonable minimum
+        min_height = max(self.window.minimumHeight(), 100)
+        info.ptMinTrackSize.x = min_width
+        info.ptMinTrackSize.y = min_height
+
+        return True, 0
+
     def _handle_hittest(self) -> Tuple[bool, int]:
         """Handle window hit-test for resizing and dragging."""
-        try:
-            # Get global and local mouse position
-            pt: QPoint = cast(QPoint, QCursor.pos()) #type: ignore
-            local: QPoint = cast(QPoint, self.window.mapFromGlobal(pt)) #type: ignore
-            x: int = int(local.x())
-            y: int = int(local.y())
-            
-            w: int = self.window.width()
-            h: int = self.window.height()
-            
-            # Get current DPI ratio for accurate border width
-            dpr: float = float(self.window.devicePixelRatio()) #type: ignore
-            bw: int = int(self.BORDER_WIDTH * dpr)
-
-            # If maximized, allow dragging only via title bar fallback
-            if self.isMaximized():
-                return self._dispatch_titlebar(pt, y)
-
-            # Corners resize areas
-            if x < bw and y < bw:
-                return True, constants.Windows.HTTOPLEFT
-            if x > w - bw and y < bw:
-                return True, constants.Windows.HTTOPRIGHT
-            if x < bw and y > h - bw:
-                return True, constants.Windows.HTBOTTOMLEFT
-            if x > w - bw and y > h - bw:
-                return True, constants.Windows.HTBOTTOMRIGHT
-
-            # Edges resize areas
-            if y < bw:
-                return True, constants.Windows.HTTOP
-            if y > h - bw:
-                return True, constants.Windows.HTBOTTOM
-            if x < bw:
-                return True, constants.Windows.HTLEFT
-            if x > w - bw:
-                return True, constants.Windows.HTRIGHT
-
-            # Title bar area for dragging
-            return self._dispatch_titlebar(pt, y)
-            
-        except Exception as e:
-            print(f"Error in hittest: {e}")
+        if self.hwnd is None:
             return False, 0
 
+        # Get global and local mouse position
+        pt: QPoint = cast(QPoint, QCursor.pos()) #type: ignore
+        local: QPoint = cast(QPoint, self.window.mapFromGlobal(pt)) #type: ignore
+        x: int = int(local.x())
+        y: int = int(local.y())
+        
+        # Border thresholds only change on resize/DPI change
+        if not self._hittest_cache_valid:
+            self._refresh_hittest_cache()
+        bw = self._cached_bw
+        w_bw = self._cached_w_minus_bw
+        h_bw = self._cached_h_minus_bw
+
+        # If maximized, allow dragging only via title bar fallback
+        if self.isMaximized():
+            return self._dispatch_titlebar(pt, y)
+
+        # Corner/edge resize areas via a bitmask lookup
+        region = (x < bw) | ((x > w_bw) << 1) | ((y < bw) << 2) | ((y > h_bw) << 3)
+        ht = _HIT_LUT[region]
+        if ht:
+            return True, ht
+
+        # Title bar area for dragging
+        return self._dispatch_titlebar(pt, y)
+
+    def _refresh_hittest_cache(self) -> None:
+        """Read window size and DPI once and derive the resize border thresholds."""
+        # Get current DPI ratio for accurate border width
+        dpr: float = float(self.window.devicePixelRatio()) #type: ignore
+        bw: int = round(self.BORDER_WIDTH * dpr)
+
+        # Read the size from the native client rect: right after WM_SIZE Qt
+        # may not have applied the new geometry to the widget yet
+        rect = wintypes.RECT()
+        if self._GetClientRect(self.hwnd, ctypes.byref(rect)):
+            w = round(rect.right / dpr)
+            h = round(rect.bottom / dpr)
+        else:
+            w = self.window.width()
+            h = self.window.height()
+
+        self._cached_bw = bw
+        self._cached_w_minus_bw = w - bw
+        self._cached_h_minus_bw = h - bw
+        self._hittest_cache_valid = True
+
+    def _invalidate_hittest_cache(self) -> None:
+        """Force the next hit-test to re-read window size and DPI."""
+        self._hittest_cache_valid = False
+
     def _dispatch_titlebar(self, global_pos: QPoint, y: int) -> Tuple[bool, int]:
         """Determine if the point is on title bar for dragging."""
         # Use custom titlebar hook if provided
@@ -345,7 +569,7 @@ class WindowsStyler:
 
         # Fallback: treat area within TITLE_BAR_FALLBACK_HEIGHT as draggable
         if self.TITLE_BAR_FALLBACK and y < self.TITLE_BAR_FALLBACK_HEIGHT:
-            return True, constants.Windows.HTCAPTION
+            return True, HTCAPTION
 
         return False, 0
 
@@ -370,29 +594,31 @@ class WindowsStyler:
 
     def _debounced_apply_corners(self) -> None:
         """Debounce corner application to avoid rapid calls."""
-        current_time = time.time()
-        
-        # Cancel existing timer
-        if self._corner_timer:
-            self._corner_timer.stop()
-            
+        if self._corner_timer is None or self._suspend_corners:
+            return
+
+        # During a drag, collapse every update into one trailing apply
+        if self._in_sizemove:
+            self._corner_timer.start(_SIZEMOVE_DEBOUNCE_MS)
+            return
+
         # If last apply was recent, delay this one (minimum 50ms)
-        time_since_last = current_time - self._last_corner_apply
-        delay = max(0, 50 - int(time_since_last * 1000))  # 50ms minimum delay
+        elapsed_ms = (time.monotonic_ns() - self._last_corner_apply) // 1_000_000
+        delay = max(0, 50 - elapsed_ms)
         
-        self._corner_timer = QTimer()
-        self._corner_timer.singleShot(delay, self._apply_corners_now)
+        # Restarting a running single-shot timer coalesces pending applies
+        self._corner_timer.start(delay)
 
     def _apply_corners_now(self) -> None:
         """Apply corners and update timestamp."""
-        self._last_corner_apply = time.time()
+        self._last_corner_apply = time.monotonic_ns()
         self.apply_rounded_corners()
 
     def showMaximized(self) -> None:
         """Show window maximized, removing rounded corners."""
         if not self.hwnd:
             return
-        constants.Windows.user32.ShowWindow(self.hwnd, constants.Windows.SW_MAXIMIZE)
+        self._ShowWindow(self.hwnd, SW_MAXIMIZE)
         self._update_maximize_button_state(True)
         self._debounced_apply_corners()
 
@@ -400,7 +626,7 @@ class WindowsStyler:
         """Restore window, applying rounded corners."""
         if not self.hwnd:
             return
-        constants.Windows.user32.ShowWindow(self.hwnd, constants.Windows.SW_RESTORE)
+        self._ShowWindow(self.hwnd, SW_RESTORE)
         self._update_maximize_button_state(False)
         self._debounced_apply_corners()
 
@@ -408,7 +634,7 @@ class WindowsStyler:
         """Check if window is maximized."""
         if not self.hwnd:
             return False
-        return bool(constants.Windows.user32.IsZoomed(self.hwnd))
+        return bool(self._IsZoomed(self.hwnd))
 
     def apply_rounded_corners(self) -> None:
         """Apply or remove rounded corners based on window maximized state."""
@@ -416,81 +642,96 @@ class WindowsStyler:
             return
             
         try:
-            if self.isMaximized():
-                # Remove region clipping and disable rounding when maximized
-                constants.Windows.user32.SetWindowRgn(self.hwnd, 0, True)
-                if self._is_windows_11:
-                    self._set_dwm_corner_preference(constants.Windows.DWMWCP_DONOTROUND)
-            else:
-                # Try native Windows 11 rounded corners first
-                if self._is_windows_11:
-                    try:
-                        self._set_dwm_corner_preference(constants.Windows.DWMWCP_ROUND)
-                        return
-                    except Exception:
-                        pass  # Fall back to manual method
-                
-                # Fallback to manual rounded region for older Windows
-                radius = int(self.ROUND_CORNER_RADIUS * float(self.window.devicePixelRatio())) #type: ignore
-                self._set_rounded_region(radius)
-                
+            self._apply_round_impl(self.isMaximized())
         except Exception as e:
             print(f"Error applying rounded corners: {e}")
 
+    def _apply_round_dwm(self, maximized: bool) -> None:
+        """Windows 11: let DWM round the corners, disabling it when maximized."""
+        if maximized:
+            # Remove region clipping and disable rounding when maximized
+            self._clear_window_region()
+            self._set_dwm_corner_preference(DWMWCP_DONOTROUND)
+            return
+
+        try:
+            self._set_dwm_corner_preference(DWMWCP_ROUND)
+        except Exception:
+            # Fall back to manual method
+            self._apply_round_gdi(False)
+
+    def _apply_round_gdi(self, maximized: bool) -> None:
+        """Older Windows: clip the window to a rounded GDI region."""
+        if maximized:
+            # Remove region clipping when maximized
+            self._clear_window_region()
+            return
+
+        radius = int(self.ROUND_CORNER_RADIUS * float(self.window.devicePixelRatio())) #type: ignore
+        self._set_rounded_region(radius)
+
+    def _clear_window_region(self) -> None:
+        """Remove any window region, skipping the call if none is applied."""
+        if self._last_applied_region == _NO_REGION:
+            return
+        if self._SetWindowRgn(self.hwnd, 0, True):
+            self._last_applied_region = _NO_REGION
+
     def _set_rounded_region(self, radius: int) -> None:
         """Apply a manual rounded rectangle region with proper resource management."""
         if not self.hwnd:
             return
             
         rect = wintypes.RECT()
-        if not constants.Windows.user32.GetWindowRect(self.hwnd, ctypes.byref(rect)):
+        if not self._GetWindowRect(self.hwnd, ctypes.byref(rect)):
             return
 
         width = rect.right - rect.left
         height = rect.bottom - rect.top
 
+        # Skip the GDI work if the same region is already applied
+        key = (False, width, height, radius)
+        if key == self._last_applied_region:
+            return
+
         region = None
         try:
             # Create a rounded rectangle region for the window
-            region = constants.Windows.gdi32.CreateRoundRectRgn(
+            region = self._CreateRoundRectRgn(
                 0, 0, width, height, radius, radius
             )
             if region:
-                # SetWindowRgn takes ownership of the region, so we don't delete it
-                constants.Windows.user32.SetWindowRgn(self.hwnd, region, True)
-                region = None  # Don't delete - ownership transferred
+                # SetWindowRgn takes ownership of the region only on success;
+                # on failure we still own it and finally deletes it
+                if self._SetWindowRgn(self.hwnd, region, True):
+                    self._last_applied_region = key
+                    region = None  # Don't delete - ownership transferred
         except Exception as e:
             print(f"Error setting rounded region: {e}")
         finally:
             # Only delete if we still own the region
             if region:
-                constants.Windows.gdi32.DeleteObject(region)
+                self._DeleteObject(region)
 
     def _set_dwm_corner_preference(self, preference: int) -> None:
         """Set Windows 11 DWM corner preference with version check."""
-        if not self._is_windows_11 or not self.hwnd:
+        if not _IS_WIN11 or not self.hwnd:
             raise RuntimeError("DWM corner preference not supported on this Windows version")
+
+        # DWM keeps the attribute until changed, so only send transitions
+        if preference == self._last_corner_pref:
+            return
             
         val = ctypes.c_int(preference)
-        hr = constants.Windows.dwmapi.DwmSetWindowAttribute(
+        hr = dwmapi.DwmSetWindowAttribute(
             self.hwnd,
-            constants.Windows.DWMWA_WINDOW_CORNER_PREFERENCE,
+            DWMWA_WINDOW_CORNER_PREFERENCE,
             ctypes.byref(val),
             ctypes.sizeof(val),
         )
         if hr != 0:
             raise ctypes.WinError(hr)
-
-    # Remove the duplicate DWM_BB_ENABLE definition since it's now in constants
-    class DWM_BLURBEHIND(ctypes.Structure):
-        _fields_ = [
-            ("dwFlags", wintypes.DWORD),
-            ("fEnable", wintypes.BOOL),
-            ("hRgnBlur", wintypes.HRGN),
-            ("fTransitionOnMaximized", wintypes.BOOL),
-        ]
-
-    # DWM_BB_ENABLE is now defined in constants module
+        self._last_corner_pref = preference
 
     def enable_acrylic_blur(self) -> None:
         """Enable acrylic blur effect behind the window."""
@@ -498,12 +739,7 @@ class WindowsStyler:
             return
             
         try:
-            blur = self.DWM_BLURBEHIND()
-            blur.dwFlags = constants.Windows.DWM_BB_ENABLE
-            blur.fEnable = True
-            blur.hRgnBlur = 0
-            blur.fTransitionOnMaximized = False
-            hr = constants.Windows.dwmapi.DwmEnableBlurBehindWindow(self.hwnd, ctypes.byref(blur))
+            hr = dwmapi.DwmEnableBlurBehindWindow(self.hwnd, ctypes.byref(_ENABLE_BLUR_BLOB))
             if hr != 0:
                 print(f"Warning: Failed to enable blur effect (HRESULT: 0x{hr:08x})")
         except Exception as e:
@@ -512,6 +748,4 @@ class WindowsStyler:
     def cleanup(self) -> None:
         """Cleanup resources when window is destroyed."""
         if self._corner_timer:
-            self._corner_timer.stop()
-        if self._original_cursor:
-            constants.Windows.user32.SetCursor(self._original_cursor)
\ No newline at end of file
+            self._corner_timer.stop()
\ No newline at end of file
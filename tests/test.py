@@ -1,6 +1,8 @@
 import unittest
+from unittest import mock
 from PySide6.QtWidgets import QApplication, QMainWindow
-from customqt.windows import WindowsStyler
+from customqt.windows import WindowsStyler, _HIT_LUT
+from customqt.constants import Windows
 
 # Ensure there is one QApplication instance for all tests
 app = QApplication.instance() or QApplication([])
@@ -30,5 +32,110 @@ class TestWindowsStyler(unittest.TestCase):
         # Check if the styler object exists
         self.assertIsNotNone(self.window.windowsStyler)
 
+class TestHitTestTable(unittest.TestCase):
+    def test_lut_matches_edge_precedence(self):
+        # Corners take priority over edges, top/left over bottom/right
+        for region in range(16):
+            left, right, top, bottom = region & 1, region & 2, region & 4, region & 8
+            if left and top:
+                expected = Windows.HTTOPLEFT
+            elif right and top:
+                expected = Windows.HTTOPRIGHT
+            elif left and bottom:
+                expected = Windows.HTBOTTOMLEFT
+            elif right and bottom:
+                expected = Windows.HTBOTTOMRIGHT
+            elif top:
+                expected = Windows.HTTOP
+            elif bottom:
+                expected = Windows.HTBOTTOM
+            elif left:
+                expected = Windows.HTLEFT
+            elif right:
+                expected = Windows.HTRIGHT
+            else:
+                expected = 0
+            self.assertEqual(_HIT_LUT[region], expected, region)
+
+class TestRoundedRegionCache(unittest.TestCase):
+    def setUp(self):
+        self.window = TestWindow()
+        self.styler = self.window.windowsStyler
+        self.styler.hwnd = 1
+        # Stub the Win32 calls normally bound in _post_init
+        self.styler._GetWindowRect = mock.Mock(side_effect=self._fill_rect)
+        self.styler._CreateRoundRectRgn = mock.Mock(return_value=1234)
+        self.styler._SetWindowRgn = mock.Mock(return_value=1)
+        self.styler._DeleteObject = mock.Mock(return_value=1)
+
+    @staticmethod
+    def _fill_rect(hwnd, rect_ref):
+        rect = rect_ref._obj
+        rect.left, rect.top, rect.right, rect.bottom = 0, 0, 400, 300
+        return 1
+
+    def test_unchanged_region_is_skipped(self):
+        self.styler._set_rounded_region(15)
+        self.styler._set_rounded_region(15)
+        self.assertEqual(self.styler._SetWindowRgn.call_count, 1)
+
+        # A different radius is a different key
+        self.styler._set_rounded_region(20)
+        self.assertEqual(self.styler._SetWindowRgn.call_count, 2)
+
+    def test_applied_region_is_not_deleted(self):
+        self.styler._set_rounded_region(15)
+        self.styler._DeleteObject.assert_not_called()
+
+    def test_failed_set_does_not_store_key(self):
+        self.styler._SetWindowRgn.return_value = 0
+        self.styler._set_rounded_region(15)
+        self.assertIsNone(self.styler._last_applied_region)
+
+        # Nothing was cached, so the next call retries
+        self.styler._set_rounded_region(15)
+        self.assertEqual(self.styler._SetWindowRgn.call_count, 2)
+
+    def test_failed_set_deletes_region(self):
+        self.styler._SetWindowRgn.return_value = 0
+        self.styler._set_rounded_region(15)
+        self.styler._DeleteObject.assert_called_once_with(1234)
+
+    def test_clear_region_is_skipped_when_already_cleared(self):
+        self.styler._clear_window_region()
+        self.styler._clear_window_region()
+        self.styler._SetWindowRgn.assert_called_once_with(1, 0, True)
+
+class TestCornerPreferenceCache(unittest.TestCase):
+    def setUp(self):
+        self.window = TestWindow()
+        self.styler = self.window.windowsStyler
+        self.styler.hwnd = 1
+
+    def test_same_preference_is_sent_once(self):
+        with mock.patch("customqt.windows._IS_WIN11", True), mock.patch.object(
+            Windows.dwmapi, "DwmSetWindowAttribute", return_value=0
+        ) as set_attr:
+            self.styler._set_dwm_corner_preference(Windows.DWMWCP_ROUND)
+            self.styler._set_dwm_corner_preference(Windows.DWMWCP_ROUND)
+            self.assertEqual(set_attr.call_count, 1)
+
+            # A transition is sent, and repeating it is skipped again
+            self.styler._set_dwm_corner_preference(Windows.DWMWCP_DONOTROUND)
+            self.styler._set_dwm_corner_preference(Windows.DWMWCP_DONOTROUND)
+            self.assertEqual(set_attr.call_count, 2)
+
+    def test_failed_preference_is_retried(self):
+        with mock.patch("customqt.windows._IS_WIN11", True), mock.patch.object(
+            Windows.dwmapi, "DwmSetWindowAttribute", return_value=1
+        ) as set_attr:
+            with self.assertRaises(OSError):
+                self.styler._set_dwm_corner_preference(Windows.DWMWCP_ROUND)
+            self.assertIsNone(self.styler._last_corner_pref)
+
+            set_attr.return_value = 0
+            self.styler._set_dwm_corner_preference(Windows.DWMWCP_ROUND)
+            self.assertEqual(set_attr.call_count, 2)
+
 if __name__ == "__main__":
     unittest.main()